@@ -7,6 +7,11 @@ from .exceptions import (
     EnvironmentVariableTypeError,
 )
 
+# Shared read-only default for classes without annotations, so class
+# creation does not allocate a fresh empty dict every time. Never
+# mutate it.
+_EMPTY = {}
+
 
 def _validate_environment_variables(cls):
     """Run through all environment variables set in this class and make
@@ -18,113 +23,138 @@ def _validate_environment_variables(cls):
     validation criteria. The error contains information on all the
     attributes that have failed the validation
     """
-    message = ''
+    # One plain-dict snapshot of the environment, shared by every
+    # variable resolved below
+    environment = dict(os.environ)
+
+    errors = []
     for name, attribute in cls.__dict__.items():
-        if isinstance(attribute, Variable):
+        # Variable is never subclassed, so an identity check beats
+        # isinstance's MRO walk
+        if type(attribute) is Variable:
             try:
-                _ = attribute.value
+                _ = attribute._resolve(environment)
             except EnvironmentVariableNotSetError:
-                message += (
+                errors.append(
                     f"Environment variable '{name}' has not been set and "
                     "has no default value\n"
                 )
             except EnvironmentVariableTypeError:
-                message += (
+                errors.append(
                     f"Environment variable '{name}' can not be cast to "
                     f"type '{attribute.type}'\n"
                 )
 
-    if message:
-        raise EnvironmentValidationError(message)
+    if errors:
+        raise EnvironmentValidationError(''.join(errors))
+
+
+def _add_variables_by_prefixes(cls, prefixes):
+    """Add a Variable for every environment variable whose name starts
+    with any of `prefixes`. `str.startswith` accepts a tuple of
+    prefixes, so the environment is scanned exactly once no matter how
+    many prefixes are given.
+    """
+    prefix_tuple = tuple(prefixes)
+    if not prefix_tuple:
+        return
+
+    # Check the class dict directly: hasattr would resolve existing
+    # Variables through their descriptor, reading the environment just
+    # to find out whether the attribute exists
+    cls_dict = cls.__dict__
+    for key in os.environ:
+        if key.startswith(prefix_tuple) and key not in cls_dict:
+            setattr(cls, key, Variable(key=key, type_=str))
 
 
 def _add_variables_by_prefix(cls, prefix):
-    variables = {
-        key: value for key, value in os.environ.items() if key.startswith(prefix)
+    _add_variables_by_prefixes(cls, (prefix,))
+
+
+def _install_variables(cls):
+    """Capture the annotated fields and bare defaults of `cls` and
+    install a Variable descriptor in the class __dict__ for each of
+    them. Shared by `EnvVarMeta` and `EnvVars.__init_subclass__`; a
+    class that reaches both paths is only scanned effectively once,
+    since attributes that already are Variables are left untouched.
+    """
+    variable_cls = Variable
+    cls_dict = cls.__dict__
+    annotations = cls_dict.get('__annotations__', _EMPTY)
+
+    # Look in the class dict for all attributes that do not start
+    # with __. These attributes will contain defaults if they exist.
+    variables_with_default = {
+        key: value
+        for key, value in cls_dict.items()
+        if not key.startswith('__') and type(value) is not variable_cls
     }
+
+    variables = {}
+
+    # Build one Variable per annotated field, picking up its
+    # default from the class body if one was given
+    for key, value in annotations.items():
+        if type(cls_dict.get(key)) is variable_cls:
+            continue
+
+        variables[key] = variable_cls(
+            key=key, type_=value, default=variables_with_default.pop(key, None)
+        )
+
+    # If any defaults are left, they have no annotation, so add
+    # them as well and infer the type from the given default.
+    for key, value in variables_with_default.items():
+        variables[key] = variable_cls(
+            key=key,
+            type_=value.class_or_type
+            if isinstance(value, _VariableTemplate)
+            else type(value),
+            default=value,
+        )
+
     for key, value in variables.items():
-        if not hasattr(cls, key):
-            setattr(cls, key, Variable(key=key, type_=str))
+        setattr(cls, key, value)
 
 
 class EnvVarMeta(type):
     """Metaclass for creating EnvVars classes. Environment variable
     classes can be created by using this metaclass, but the recommended
-    way is to use the `@environment_variables` wrapper.
+    ways are to use the `@environment_variables` wrapper or to subclass
+    `EnvVars`.
     """
 
     def __new__(mcs, name, bases, dictionary):
-        """When creating a new EnvVars class, capture the
-        set attributes of the class and add entries in the
-        class.__dict__, where each attribute is stored as
-        a Variable object.
-        """
         cls = super().__new__(mcs, name, bases, dictionary)
+        _install_variables(cls)
 
-        variables = {}
-
-        # First, look in __annotations__ to see if there are
-        # anny fields there that need to be captured. These
-        # attributes will only have a name and a type annotation
-        for key, value in dictionary.get('__annotations__', {}).items():
-            variables[key] = Variable(key=key, type_=value)
-
-        # Look in the dictionary for all attributes that have
-        # do not start with __. These attributes will contain
-        # defaults if they exist.
-        variables_with_default = {
-            key: value for key, value in dictionary.items() if not key.startswith('__')
-        }
-
-        # Update the captured variables with their default
-        # value, if any such value is present, and the annotated
-        # type.
-        variables = {
-            key: Variable(
-                key=key, type_=value.type, default=variables_with_default.pop(key, None)
-            )
-            for key, value in variables.items()
-        }
-
-        # If any variables are left, add them as well, and
-        # infer the type from the given default.
-        variables.update(
-            {
-                key: Variable(
-                    key=key,
-                    type_=value.class_or_type
-                    if isinstance(value, _VariableTemplate)
-                    else type(value),
-                    default=value,
-                )
-                for key, value in variables_with_default.items()
-            }
-        )
-
-        for key, value in variables.items():
-            setattr(cls, key, value)
+        return cls
 
-        setattr(cls, 'validate', classmethod(_validate_environment_variables))
-        setattr(cls, 'add_variables_by_prefix', classmethod(_add_variables_by_prefix))
+    # Defined on the metaclass, these behave like classmethods on
+    # every EnvVars class without being re-attached per class creation
+    validate = _validate_environment_variables
+    add_variables_by_prefix = _add_variables_by_prefix
+    add_variables_by_prefixes = _add_variables_by_prefixes
 
-        return cls
 
-    def __getattribute__(self, item):
-        """Override __getattribute__ to return the variable
-        value if the item is an instance of a variable.
-        """
-        attribute = super().__getattribute__(item)
-        if isinstance(attribute, Variable):
-            return attribute.value
+class EnvVars:
+    """Base class for environment variable classes. Subclassing this
+    class is equivalent to wrapping the class with the
+    `environment_variables` function, but installs the Variable
+    descriptors through `__init_subclass__`, keeping metaclass
+    machinery off the attribute access path entirely.
+    """
 
-        return attribute
+    __slots__ = ()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _install_variables(cls)
 
-class EnvVars(metaclass=EnvVarMeta):
-    """Base class using the EnvVarMeta metaclass. Subclassing this class
-    is equivalent to wrapping the class with the `environment_variables`
-    function.
-    """
+    validate = classmethod(_validate_environment_variables)
+    add_variables_by_prefix = classmethod(_add_variables_by_prefix)
+    add_variables_by_prefixes = classmethod(_add_variables_by_prefixes)
 
 
 def environment_variables(cls=None, *, validate=False, collect_prefixes=None):
@@ -162,12 +192,19 @@ def environment_variables(cls=None, *, validate=False, collect_prefixes=None):
     def wrap(old_cls):
         name = str(old_cls.__name__)
         bases = tuple(old_cls.__bases__)
-        class_dict = dict(old_cls.__dict__)
+        # type() only accepts a real dict, so a copy of the mappingproxy
+        # is unavoidable, but the __dict__ and __weakref__ slot
+        # descriptors of the wrapped class do not belong in the new one
+        class_dict = {
+            key: value
+            for key, value in old_cls.__dict__.items()
+            if key != '__dict__' and key != '__weakref__'
+        }
 
         new_cls = EnvVarMeta(name, bases, class_dict)
 
-        for prefix in collect_prefixes:
-            new_cls.add_variables_by_prefix(prefix)
+        if collect_prefixes:
+            new_cls.add_variables_by_prefixes(collect_prefixes)
 
         if validate:
             new_cls.validate()
@@ -16,13 +16,40 @@ class EnvironmentValidationError(EnvironmentVariableError):
 
 class EnvironmentVariableNotSetError(EnvironmentVariableError):
     """Raised when trying to access the value of an environment variable
-    that has not been set on the system, and has no default defined
+    that has not been set on the system, and has no default defined.
+
+    Raised with the variable name as its only argument; the
+    human-readable message is formatted lazily in __str__, so raising
+    and catching during validation does not build any strings.
     """
 
+    def __str__(self):
+        if len(self.args) == 1:
+            return (
+                f"The environment variable '{self.args[0]}' is not set "
+                "and no default has been provided"
+            )
+
+        return super().__str__()
+
 
 class EnvironmentVariableTypeError(EnvironmentVariableError):
     """Raised if the value of an environment variable cannot be cast to
     the desired type, or if the annotated type or class does not match
     the type or class of the provided default value, or any other
-    occasion when values and types do not match
+    occasion when values and types do not match.
+
+    Cast failures raise this with structured (key, value, type)
+    arguments and format the message lazily in __str__; other call
+    sites pass a ready-made message.
     """
+
+    def __str__(self):
+        if len(self.args) == 3:
+            key, value, type_ = self.args
+            return (
+                f"Error reading environment variable '{key}': cannot "
+                f"cast value '{value}' to type '{type_}'"
+            )
+
+        return super().__str__()
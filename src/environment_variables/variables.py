@@ -4,6 +4,63 @@ import typing
 
 from .exceptions import EnvironmentVariableNotSetError, EnvironmentVariableTypeError
 
+# Sentinel marking that a variable has not been resolved yet. Falsy
+# values ('', 0, 0.0, False) are all valid environment variable values,
+# so 'not yet read' needs a marker that can never collide with them.
+_MISSING = object()
+
+# Common spellings of boolean environment variables, checked with a
+# single hash lookup before falling back to lowercasing the raw string.
+_TRUE = frozenset(('true', 'True', 'TRUE', '1'))
+_FALSE = frozenset(('false', 'False', 'FALSE', '0'))
+
+
+def _cast_bool(raw_value):
+    """Cast the raw value of an environment variable to a boolean.
+
+    :raises ValueError: if the value is not a recognized boolean
+    spelling; _resolve wraps it into an EnvironmentVariableTypeError
+    carrying the variable name
+    """
+    # Plain defaults are returned before the caster runs, but template
+    # defaults are not, and may already be booleans rather than raw
+    # strings
+    if isinstance(raw_value, bool):
+        return raw_value
+
+    if raw_value in _TRUE:
+        return True
+
+    if raw_value in _FALSE:
+        return False
+
+    # Only lowercase once, and only for the unusual spellings
+    # that the frozensets above do not cover
+    lowered = raw_value.lower()
+    if lowered not in ('true', 'false'):
+        # Let _resolve wrap this into an EnvironmentVariableTypeError
+        # carrying the variable name, like any other cast failure
+        raise ValueError(raw_value)
+
+    return lowered == 'true'
+
+
+def _make_caster(type_, args, kwargs):
+    """Build a caster that forwards extra constructor arguments from a
+    variable template to the target class or type.
+    """
+
+    def caster(raw_value):
+        return type_(raw_value, *args, **kwargs)
+
+    return caster
+
+
+# Types that need more than a plain constructor call are dispatched
+# through this table; anything else is called directly with the raw
+# string value
+_CASTERS = {bool: _cast_bool}
+
 
 @dataclasses.dataclass(frozen=True)
 class _VariableTemplate:
@@ -15,6 +72,19 @@ class _VariableTemplate:
 
 
 class Variable:
+    __slots__ = (
+        'key',
+        '_type',
+        'default',
+        '_value',
+        '_unset',
+        '_args',
+        '_kwargs',
+        '_template_default',
+        '_default_factory',
+        '_caster',
+    )
+
     def __init__(
         self,
         key: str,
@@ -32,14 +102,15 @@ class Variable:
         self.key = key
         self._type = type_
         self.default = default
-        self._value = None
+        self._value = _MISSING
+        self._unset = False
         self._args = None
         self._kwargs = None
         self._template_default = None
         self._default_factory = None
 
         if isinstance(self.default, _VariableTemplate):
-            if self._type is not None and self._type != self.default.class_or_type:
+            if self._type is not None and self._type is not self.default.class_or_type:
                 raise EnvironmentVariableTypeError(
                     f"The default value '{self.default.class_or_type}' is not of type '"
                     f"{self._type}'"
@@ -52,11 +123,22 @@ class Variable:
             self._default_factory = self.default.default_factory
             self.default = None
 
-        if self.default is not None and type(self.default) != self._type:
+        if self.default is not None and type(self.default) is not self._type:
             raise EnvironmentVariableTypeError(
                 f"The default value '{self.default}' is not of type '{self._type}'"
             )
 
+        # Pick the cast function once, so .value does not have to
+        # re-dispatch on the type on every uncached access. Go through
+        # the type property, which unwraps templates given in type_
+        # position to their class_or_type.
+        if self._default_factory:
+            self._caster = self._default_factory
+        elif self._args or self._kwargs:
+            self._caster = _make_caster(self._type, self._args, self._kwargs)
+        else:
+            self._caster = _CASTERS.get(self.type, self.type)
+
     @property
     def value(self):
         """Access the value of the environment variable.
@@ -69,56 +151,63 @@ class Variable:
         back on
         :raises EnvironmentVariableTypeError: if the environment variable
         cannot be cast to the desired type
+
+        The resolved value is cached, so the environment is only read
+        and the cast only performed on the first access.
         """
-        if self._value:
+        if self._value is not _MISSING:
             return self._value
 
-        default = self.default if self.default is not None else self._template_default
-        raw_value = os.getenv(self.key, default=default)
-
-        if raw_value is None:
-            raise EnvironmentVariableNotSetError(
-                f"The environment variable '{self.key}' is not set and no default "
-                "has been provided"
-            )
-
-        if self._default_factory:
-            return self._default_factory(raw_value)
-
-        if self._args or self._kwargs:
-            return self.type(raw_value, *self._args, **self._kwargs)
+        return self._resolve(os.environ)
 
-        if self._type == bool:
-            # If the raw value is a boolean, that means that
-            # the environment variable was not set, and that
-            # we fell back on the default value, which already
-            # is a boolean
-            if isinstance(raw_value, bool):
-                return raw_value
+    def _resolve(self, env_map):
+        """Resolve and cache the value against `env_map`, a mapping
+        standing in for `os.environ`. Validation passes a plain dict
+        snapshot of the environment here, so resolving many variables
+        in one go does not pay the os.environ encode-and-lookup
+        machinery per variable.
+        """
+        if self._value is not _MISSING:
+            return self._value
 
-            if raw_value in ['0', '1']:
-                return bool(int(raw_value))
+        if self._unset:
+            raise EnvironmentVariableNotSetError(self.key)
 
-            if raw_value.lower() not in ['true', 'false']:
-                raise EnvironmentVariableTypeError(
-                    f"The value '{raw_value}' can not be cast to 'boolean'"
-                )
+        default = self.default if self.default is not None else self._template_default
+        raw_value = env_map.get(self.key, default)
 
-            # Return true if we have the string 'true' and
-            # false if we have the string 'false'
-            return raw_value.lower() == 'true'
+        if raw_value is None:
+            self._unset = True
+            raise EnvironmentVariableNotSetError(self.key)
+
+        # If getenv fell back on the default, it is already of the
+        # right type and needs no casting. Template defaults are raw
+        # strings and still go through the caster below.
+        if raw_value is self.default and self.default is not None:
+            self._value = self.default
+            return self._value
 
-        # Cast the raw value to our desired type
+        # Cast the raw value to our desired type. The structured
+        # arguments keep the raise cheap; the exception formats its
+        # message lazily when actually displayed
         try:
-            self._value = self.type(raw_value)
+            self._value = self._caster(raw_value)
         except ValueError as error:
             raise EnvironmentVariableTypeError(
-                f"Error reading environment variable '{self.key}': cannot cast"
-                f"value '{raw_value}' to type '{self._type}'"
+                self.key, raw_value, self._type
             ) from error
 
         return self._value
 
+    def __get__(self, instance, owner=None):
+        """Variables are installed as class attributes, so the
+        descriptor protocol routes attribute access on the class (or on
+        its instances) straight to the resolved value. Attributes that
+        are not Variables are untouched by this, unlike a metaclass
+        __getattribute__ override which would intercept every lookup.
+        """
+        return self.value
+
     @property
     def type(self):
         if isinstance(self._type, _VariableTemplate):
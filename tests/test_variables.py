@@ -3,7 +3,7 @@ import itertools
 
 import pytest
 
-from src.environment_variables.variables import Variable, _VariableTemplate
+from src.environment_variables.variables import Variable, _VariableTemplate, variable
 from src.environment_variables.exceptions import (
     EnvironmentVariableNotSetError,
     EnvironmentVariableTypeError,
@@ -92,6 +92,32 @@ def test_if_attribute_is_defined_as_variable_template_then_variable_type_matches
     assert SomeClass == variable.type
 
 
+def test_variable_template_in_type_position_casts_value(environment_variables):
+    # Given
+    variable_template = variable(str)
+    string_variable = Variable(key='STRING_VALUE', type_=variable_template)
+
+    # When
+    value = string_variable.value
+
+    # Then
+    assert environment_variables.get('STRING_VALUE') == value
+    assert isinstance(value, str)
+
+
+def test_boolean_template_default_is_returned_if_env_var_is_undefined():
+    # Given
+    boolean_variable = Variable(
+        key='DOES_NOT_EXIST', type_=bool, default=variable(bool, default=True)
+    )
+
+    # When
+    value = boolean_variable.value
+
+    # Then
+    assert value is True
+
+
 @pytest.mark.parametrize(
     'boolean_representation', ['truth', 'YES', 'falsely', 'NO', '2', '-1', '0.0']
 )